@@ -11,16 +11,18 @@ path = os.path.expanduser("~/nexus/ideal/channel")
 counter = 0
 
 if __name__ == "__main__":
-    with open(path, "r+") as loopfile:
+    fd = os.open(path, os.O_RDWR)
+    try:
         while True:
             assert (
-                loopfile.read() == ""
+                os.read(fd, 4096) == b""
             ), "Expected there to be no message but found one."
-            msg = f"[{counter}]"
+            msg = b"[%d]" % counter
             counter += 1
-            loopfile.write(msg)
-            loopfile.flush()
+            os.write(fd, msg)
             time.sleep(1)
             assert (
-                found := loopfile.read()
+                found := os.read(fd, 4096)
             ) == msg, f"Expected to read {msg} but found {found}"
+    finally:
+        os.close(fd)
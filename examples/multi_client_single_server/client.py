@@ -8,15 +8,17 @@ and it is expected the file will preserve message boundaries.
 
 import os
 import sys
-import time
 
 client_num = int(sys.argv[1])
 nexus_sock = os.path.expanduser("~/nexus/direct/channel")
+# Only the counter changes between messages
+SUFFIX = f": Hello from client {client_num}!".encode()
 
 counter = 0
-while True:
-    with open(nexus_sock, "r+") as infile:
-        while infile.read():
-            pass
-        infile.write(f"[{counter}]: Hello from client {client_num}!")
+with open(nexus_sock, "rb+", buffering=0) as infile:
+    while True:
+        # An unsized read keeps reading until the channel comes back empty,
+        # so a single call drains every pending reply
+        infile.read()
+        infile.write(b"[%d]" % counter + SUFFIX)
         counter += 1
@@ -8,12 +8,18 @@ them to preserve message boundaries.
 import os
 
 nexus_sock = os.path.expanduser("~/nexus/direct/channel")
+# Client messages end in "client N!", so the digit sits right after this
+CLIENT_TAG = b"client "
 
 counter = 0
-while True:
-    with open(nexus_sock, "r+") as infile:
+with open(nexus_sock, "rb+", buffering=0) as infile:
+    while True:
         msg = infile.read()
         if msg:
-            client = 1 if "client 1" in msg else 2
-            infile.write(f"[{counter}]: Hello, client {client}! (Received {msg})")
-        counter += 1
+            i = msg.rfind(CLIENT_TAG) + len(CLIENT_TAG)
+            # No tag (rfind gives -1) or a tag at the very end falls back to 2
+            client = 1 if i >= len(CLIENT_TAG) and msg[i : i + 1] == b"1" else 2
+            infile.write(
+                b"[%d]: Hello, client %d! (Received %s)" % (counter, client, msg)
+            )
+            counter += 1
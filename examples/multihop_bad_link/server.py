@@ -4,21 +4,35 @@ server.py
 Response to proxyRelay multihop back from client to server and back.
 """
 
+import functools
 import os
 import sys
 import time
 
 proxy_path = os.path.expanduser("~/nexus/proxy_server/channel")
 
+# set NEXUS_DEBUG=1 for per-message traces
+DEBUG = bool(os.environ.get("NEXUS_DEBUG"))
+_err = functools.partial(os.write, sys.stderr.fileno())
+
+# poll fast right after traffic, back off to POLL_MAX when idle
+POLL_MIN = 0.01
+POLL_MAX = 0.25
+
 try:
-    while True:
-        with open(proxy_path, "r+", errors="replace") as proxy:
-            while msg := proxy.read():
-                payload = msg + "[Server]"
-                print(f"msg: {msg}", file=sys.stderr)
-                print(f"Wrote: {payload}", file=sys.stderr)
-                proxy.write(payload)
-                proxy.flush()
-        time.sleep(0.25)
+    with open(proxy_path, "rb+", buffering=0) as proxy:
+        read, write = proxy.read, proxy.write
+        sleep = time.sleep
+        delay = POLL_MAX
+        while True:
+            delay = min(delay * 2, POLL_MAX)
+            # An unsized read drains every queued message, so one is enough
+            if msg := read():
+                payload = msg + b"[Server]"
+                if DEBUG:
+                    _err(b"msg: %s\nWrote: %s\n" % (msg, payload))
+                write(payload)
+                delay = POLL_MIN
+            sleep(delay)
 except Exception as e:
     print(str(e), file=sys.stderr)
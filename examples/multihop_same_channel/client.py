@@ -4,28 +4,34 @@ client.py
 Initiate a multi-hop communication chain.
 """
 
+import functools
 import os
 import sys
 import time
 
 path = os.path.expanduser("~/nexus/main/channel")
 
+# set NEXUS_DEBUG=1 for per-message traces
+DEBUG = bool(os.environ.get("NEXUS_DEBUG"))
+_out = functools.partial(os.write, sys.stdout.fileno())
+
 counter = 0
 try:
-    while True:
-        with open(path, "r+") as ch:
+    with open(path, "rb+", buffering=0) as ch:
+        while True:
             while msg := ch.read():
-                print(f"[Client RX]: {msg}")
+                if DEBUG:
+                    _out(b"[Client RX]: %s\n" % msg)
                 # make sure we only ever receive proxied messages
-                if msg.endswith("[Proxy 1]") or msg.endswith("[Proxy 2]"):
+                if msg.endswith((b"[Proxy 1]", b"[Proxy 2]")):
                     continue
                 else:
-                    print(f"Failure! {msg}", file=sys.stderr)
+                    text = msg.decode(errors="replace")
+                    print(f"Failure! {text}", file=sys.stderr)
                     sys.exit(1)
-            msg = f"[Client RX ({counter})]"
+            msg = b"[Client RX (%d)]" % counter
             ch.write(msg)
-            ch.flush()
             counter += 1
-        time.sleep(0.25)
+            time.sleep(0.25)
 except Exception as e:
     print(str(e), file=sys.stderr)
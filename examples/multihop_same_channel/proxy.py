@@ -4,6 +4,7 @@ proxy.py
 Relay multihop back from client to server and back.
 """
 
+import functools
 import os
 import re
 import sys
@@ -11,26 +12,41 @@ import time
 
 path = os.path.expanduser("~/nexus/main/channel")
 
+# set NEXUS_DEBUG=1 for per-message traces
+DEBUG = bool(os.environ.get("NEXUS_DEBUG"))
+_out = functools.partial(os.write, sys.stdout.fileno())
+
+# poll fast right after traffic, back off to POLL_MAX when idle
+POLL_MIN = 0.01
+POLL_MAX = 0.25
+
 try:
-    while True:
-        with open(path, "r+") as ch:
-            while msg := ch.read().strip():
-                print(f"Received: {msg}")
+    with open(path, "rb+", buffering=0) as ch:
+        read, write = ch.read, ch.write
+        sleep = time.sleep
+        delay = POLL_MAX
+        while True:
+            delay = min(delay * 2, POLL_MAX)
+            while msg := read().strip():
+                if DEBUG:
+                    _out(b"Received: %s\n" % msg)
                 # coming back from server
-                if msg.endswith("[Server]"):
-                    payload = msg + "[Proxy 2]"
-                    print(f"Writing {payload}")
-                    ch.write(payload)
-                    ch.flush()
+                if msg.endswith(b"[Server]"):
+                    payload = msg + b"[Proxy 2]"
+                    if DEBUG:
+                        _out(b"Writing %s\n" % payload)
+                    write(payload)
                 # just received by client
-                elif re.match(r"\[Client RX \(\d+\)\]$", msg):
-                    payload = msg + "[Proxy 1]"
-                    print(f"Writing {payload}")
-                    ch.write(payload)
-                    ch.flush()
+                elif re.match(rb"\[Client RX \(\d+\)\]$", msg):
+                    payload = msg + b"[Proxy 1]"
+                    if DEBUG:
+                        _out(b"Writing %s\n" % payload)
+                    write(payload)
                 else:
-                    print(f"Unknown message: {msg}", file=sys.stderr)
+                    text = msg.decode(errors="replace")
+                    print(f"Unknown message: {text}", file=sys.stderr)
                     sys.exit(1)
-        time.sleep(0.25)
+                delay = POLL_MIN
+            sleep(delay)
 except Exception as e:
     print(str(e), file=sys.stderr)
@@ -4,27 +4,40 @@ server.py
 Relay multihop back from client to server and back.
 """
 
+import functools
 import os
 import sys
 import time
 
 path = os.path.expanduser("~/nexus/main/channel")
 
+# set NEXUS_DEBUG=1 for per-message traces
+DEBUG = bool(os.environ.get("NEXUS_DEBUG"))
+_out = functools.partial(os.write, sys.stdout.fileno())
+
+# poll fast right after traffic, back off to POLL_MAX when idle
+POLL_MIN = 0.01
+POLL_MAX = 0.25
+
 try:
-    while True:
-        with open(path, "r+") as ch:
-            while msg := ch.read():
-                print(f"[Server RX]: {msg}")
+    with open(path, "rb+", buffering=0) as ch:
+        read, write = ch.read, ch.write
+        sleep = time.sleep
+        delay = POLL_MAX
+        while True:
+            delay = min(delay * 2, POLL_MAX)
+            if msg := read():
+                if DEBUG:
+                    _out(b"[Server RX]: %s\n" % msg)
                 # make sure we only ever receive proxied messages
-                if msg.endswith("[Proxy 1]"):
-                    payload = msg + "[Server]"
-                    ch.write(payload)
-                    ch.flush()
-                elif msg.endswith("[Proxy 2]"):
-                    continue
-                else:
-                    print(f"Failure! {msg}", file=sys.stderr)
+                if msg.endswith(b"[Proxy 1]"):
+                    payload = msg + b"[Server]"
+                    write(payload)
+                    delay = POLL_MIN
+                elif not msg.endswith(b"[Proxy 2]"):
+                    text = msg.decode(errors="replace")
+                    print(f"Failure! {text}", file=sys.stderr)
                     sys.exit(1)
-        time.sleep(0.25)
+            sleep(delay)
 except Exception as e:
     print(str(e), file=sys.stderr)
@@ -4,24 +4,29 @@ client.py
 Initiate a multi-hop communication chain.
 """
 
+import functools
 import os
 import sys
 import time
 
 proxy_path = os.path.expanduser("~/nexus/client_proxy/channel")
 
+# set NEXUS_DEBUG=1 for per-message traces
+DEBUG = bool(os.environ.get("NEXUS_DEBUG"))
+_out = functools.partial(os.write, sys.stdout.fileno())
+
 counter = 0
 try:
-    while True:
-        with open(proxy_path, "r+") as proxy:
+    with open(proxy_path, "rb+", buffering=0) as proxy:
+        while True:
             while msg := proxy.read():
-                print(f"[Client RX]: {msg}")
-                if "[Proxy 1][Server][Proxy 2]" not in msg:
+                if DEBUG:
+                    _out(b"[Client RX]: %s\n" % msg)
+                if b"[Proxy 1][Server][Proxy 2]" not in msg:
                     sys.exit(1)
-            msg = f"[{counter}]"
+            msg = b"[%d]" % counter
             proxy.write(msg)
-            proxy.flush()
             counter += 1
-        time.sleep(0.25)
+            time.sleep(0.25)
 except Exception as e:
     print(str(e), file=sys.stderr)
@@ -4,6 +4,7 @@ proxy.py
 Relay multihop back from client to server and back.
 """
 
+import functools
 import os
 import sys
 import time
@@ -11,23 +12,36 @@ import time
 client_path = os.path.expanduser("~/nexus/client_proxy/channel")
 server_path = os.path.expanduser("~/nexus/proxy_server/channel")
 
+# set NEXUS_DEBUG=1 for per-message traces
+DEBUG = bool(os.environ.get("NEXUS_DEBUG"))
+_out = functools.partial(os.write, sys.stdout.fileno())
+
+# poll fast right after traffic, back off to POLL_MAX when idle
+POLL_MIN = 0.01
+POLL_MAX = 0.25
+
 try:
-    while True:
-        with open(client_path, "r+") as client:
-            with open(server_path, "r+") as server:
-                while msg := client.read():
-                    print(f"Received: {msg}")
-                    payload = msg + "[Proxy 1]"
-                    server.write(payload)
-                    server.flush()
-                while msg := server.read():
+    with open(client_path, "rb+", buffering=0) as client:
+        with open(server_path, "rb+", buffering=0) as server:
+            client_read, client_write = client.read, client.write
+            server_read, server_write = server.read, server.write
+            sleep = time.sleep
+            delay = POLL_MAX
+            while True:
+                delay = min(delay * 2, POLL_MAX)
+                if msg := client_read():
+                    if DEBUG:
+                        _out(b"Received: %s\n" % msg)
+                    server_write(msg + b"[Proxy 1]")
+                    delay = POLL_MIN
+                if msg := server_read():
                     # Make sure this message was stamped by us before
-                    if "[Proxy 1][Server]" not in msg:
-                        print(f"Failure! {msg}", file=sys.stderr)
+                    if b"[Proxy 1][Server]" not in msg:
+                        text = msg.decode(errors="replace")
+                        print(f"Failure! {text}", file=sys.stderr)
                         sys.exit(1)
-                    payload = msg + "[Proxy 2]"
-                    client.write(payload)
-                    client.flush()
-        time.sleep(0.25)
+                    client_write(msg + b"[Proxy 2]")
+                    delay = POLL_MIN
+                sleep(delay)
 except Exception as e:
     print(str(e), file=sys.stderr)
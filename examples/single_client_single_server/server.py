@@ -4,9 +4,9 @@ import time
 nexus_sock = os.path.expanduser("~/nexus/direct/channel")
 
 counter = 0
-while True:
-    with open(nexus_sock, "r+") as infile:
-        print(infile.read())
-        infile.write(f"[{counter}]: Hello from the server!")
+with open(nexus_sock, "rb+", buffering=0) as infile:
+    while True:
+        print(infile.read().decode())
+        infile.write(b"[%d]: Hello from the server!" % counter)
         counter += 1
-    time.sleep(1)
+        time.sleep(1)
@@ -14,37 +14,41 @@ GUARD_LENGTH = 0.1
 
 MS = 0.001
 TTL_MS = 100
+# well inside TTL_MS so a poll never misses a message
+POLL_INTERVAL = 10 * MS
+
+WINDOW_FMT = b"Window: %d"
+
+now = time.monotonic
 
 
 def sleep_until(deadline: float):
-    time.sleep(max(0, deadline - time.time()))
+    time.sleep(max(0, deadline - now()))
 
 
 if __name__ == "__main__":
-    with open(radio_path, "r+", errors="replace") as conn:
+    with open(radio_path, "rb+", buffering=0) as conn:
         while True:
             # 1. Sync - Send the start of the window
-            window_start = round(time.time()) + SLOT_LENGTH
-            msg = f"Window: {window_start}"
+            window_start = round(now()) + SLOT_LENGTH
+            msg = WINDOW_FMT % window_start
             conn.write(msg)
-            conn.flush()
-            expiration = time.time() + TTL_MS * MS
+            expiration = now() + TTL_MS * MS
 
             # Testing code to ensure correct operation of medium
             # Wait to read own write
-            counter = 0
             read_own_write = False
-            while time.time() < expiration:
+            while now() < expiration:
                 if conn.read() == msg:
                     read_own_write = True
                     break
-                counter += 1
+                time.sleep(MS)
             assert read_own_write, "Gateway: Didn't read own write."
             # Wait until the message should be expired and try again
             # Assume this is an ideal link and transmission time is
             # neglible. Add slight guard period.
             sleep_until(expiration + GUARD_LENGTH)
-            assert conn.read() == "", "Gateway: Reading write beyond TTL"
+            assert conn.read() == b"", "Gateway: Reading write beyond TTL"
 
             # 2. Listen to as many nodes as possible that want to talk
             listen_for_next = True
@@ -54,9 +58,11 @@ if __name__ == "__main__":
                 listen_for_next = False
                 sleep_until(slot_start)
                 slot_start += SLOT_LENGTH
-                while time.time() < slot_start:
+                while now() < slot_start:
                     msg = conn.read()
                     if msg:
-                        print(f'Gateway: Received message: "{msg}"')
+                        text = msg.decode(errors="replace")
+                        print(f'Gateway: Received message: "{text}"')
                         listen_for_next = True
                         break
+                    time.sleep(POLL_INTERVAL)
@@ -15,28 +15,33 @@ SLOT_LENGTH = 1
 GUARD_LENGTH = 0.1
 
 MS = 0.001
+# well inside the radio's 100 ms TTL so a poll never misses the sync
+POLL_INTERVAL = 10 * MS
+
+WINDOW_PREFIX = b"Window: "
+
+now = time.monotonic
 
 
 def sleep_until(deadline: float):
-    time.sleep(max(0, deadline - time.time()))
+    time.sleep(max(0, deadline - now()))
 
 
 if __name__ == "__main__":
     counter = 0
-    with open(radio_path, "r+", errors="replace") as conn:
+    with open(radio_path, "rb+", buffering=0) as conn:
         while True:
             # 1. Wait for a sync message by gateway
-            while "Window" not in (msg := conn.read()):
-                time.sleep(MS)
+            while not (msg := conn.read()).startswith(WINDOW_PREFIX):
+                time.sleep(POLL_INTERVAL)
 
             # 2. Wait for turn and check that every other slot gets sent
-            start = int(msg.split()[1])
+            start = int(msg[len(WINDOW_PREFIX) :])
             my_slot = start + (client_id - 1) * SLOT_LENGTH
             sleep_until(my_slot)
 
             # 3. My turn! Send a message.
             time.sleep(GUARD_LENGTH)
-            msg = f"[Client {client_id}][{counter}]"
+            msg = b"[Client %d][%d]" % (client_id, counter)
             conn.write(msg)
-            conn.flush()
             counter += 1